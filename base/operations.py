@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 
-from typing import List
+from typing import Iterator, List
 import datetime
 
 import networkx as nx  # type: ignore
@@ -82,8 +82,8 @@ class NoSQLKnowledgeGraph(ABC):
         """Retrieves the community report for a given community id."""
 
     @abstractmethod
-    def list_communities(self) -> List[CommunityData]:
-        """Lists all stored communities for the given network."""
+    def list_communities(self) -> Iterator[CommunityData]:
+        """Lazily yields all stored communities for the given network."""
 
     @abstractmethod
     def clean_zerodegree_nodes(self) -> None:
@@ -10,7 +10,7 @@ from dotenv import dotenv_values
 import networkx as nx  # type: ignore
 
 from base.operations import NoSQLKnowledgeGraph
-from databases.firestore_kg import FirestoreKG
+from databases.firestore_kg import FirestoreKG, _DocumentCache
 from databases.n4j import AuraKG
 from databases.mdb import MongoKG
 from datamodel.data_model import NodeData, EdgeData
@@ -770,6 +770,231 @@ class FirestoreKGTests(_NoSQLKnowledgeGraphTests, unittest.TestCase):
         fskg.flush_kg()
         return fskg
 
+    def test_get_incoming(self):
+        """Test retrieving the nodes with an edge pointing to a given node."""
+
+        # Add nodes A, B and C
+        for node_uid in ["test_incoming_node_a", "test_incoming_node_b", "test_incoming_node_c"]:
+            node_data = NodeData(
+                node_uid=node_uid,
+                node_title="Test Node",
+                node_type="Person",
+                node_description="This is a test node",
+                node_degree=0,
+                document_id="doc_1",
+                edges_to=[],
+                edges_from=[],
+                embedding=[0.1, 0.2, 0.3],
+            )
+            self.kg.add_node(node_uid=node_uid, node_data=node_data)
+
+        # add directed edges A -> B and C -> B
+        for source_uid in ["test_incoming_node_a", "test_incoming_node_c"]:
+            edge_data = EdgeData(
+                source_uid=source_uid,
+                target_uid="test_incoming_node_b",
+                description="This is a test egde description",
+                directed=True
+            )
+            self.kg.add_edge(edge_data=edge_data)
+
+        # Assert that exactly A and C point to B
+        self.assertEqual(set(self.kg.get_incoming("test_incoming_node_b")),  # type: ignore
+                         {"test_incoming_node_a", "test_incoming_node_c"})
+        self.assertEqual(self.kg.get_incoming("test_incoming_node_a"), [])  # type: ignore
+
+        # Clean Up egdes
+        for source_uid in ["test_incoming_node_a", "test_incoming_node_c"]:
+            self.kg.remove_edge(source_uid=source_uid,
+                                target_uid="test_incoming_node_b")
+
+        # Clean Up nodes
+        for node_uid in ["test_incoming_node_a", "test_incoming_node_b", "test_incoming_node_c"]:
+            self.kg.remove_node(node_uid=node_uid)
+
+    def test_get_outgoing(self):
+        """Test retrieving the nodes a given node has an edge to from the edges collection."""
+
+        # Add nodes A, B and C
+        for node_uid in ["test_outgoing_node_a", "test_outgoing_node_b", "test_outgoing_node_c"]:
+            node_data = NodeData(
+                node_uid=node_uid,
+                node_title="Test Node",
+                node_type="Person",
+                node_description="This is a test node",
+                node_degree=0,
+                document_id="doc_1",
+                edges_to=[],
+                edges_from=[],
+                embedding=[0.1, 0.2, 0.3],
+            )
+            self.kg.add_node(node_uid=node_uid, node_data=node_data)
+
+        # add directed edges A -> B and A -> C
+        for target_uid in ["test_outgoing_node_b", "test_outgoing_node_c"]:
+            edge_data = EdgeData(
+                source_uid="test_outgoing_node_a",
+                target_uid=target_uid,
+                description="This is a test egde description",
+                directed=True
+            )
+            self.kg.add_edge(edge_data=edge_data)
+
+        # Assert that A points to exactly B and C, matching its edges_to list
+        self.assertEqual(set(self.kg.get_outgoing("test_outgoing_node_a")),  # type: ignore
+                         {"test_outgoing_node_b", "test_outgoing_node_c"})
+        self.assertEqual(set(self.kg.get_outgoing("test_outgoing_node_a")),  # type: ignore
+                         set(self.kg.get_node("test_outgoing_node_a").edges_to))
+        self.assertEqual(self.kg.get_outgoing("test_outgoing_node_b"), [])  # type: ignore
+
+        # Clean Up egdes
+        for target_uid in ["test_outgoing_node_b", "test_outgoing_node_c"]:
+            self.kg.remove_edge(source_uid="test_outgoing_node_a",
+                                target_uid=target_uid)
+
+        # Clean Up nodes
+        for node_uid in ["test_outgoing_node_a", "test_outgoing_node_b", "test_outgoing_node_c"]:
+            self.kg.remove_node(node_uid=node_uid)
+
+
+class DocumentCacheTests(unittest.TestCase):
+    """Test cases for the in-process document cache of FirestoreKG, no database required."""
+
+    def test_eviction(self):
+        """Least recently used documents are evicted once maxsize is exceeded"""
+        cache = _DocumentCache(maxsize=2)
+        cache.put("nodes", "node_1", {"node_uid": "node_1"})
+        cache.put("nodes", "node_2", {"node_uid": "node_2"})
+
+        # touch node_1, so node_2 becomes the least recently used entry
+        self.assertIsNotNone(cache.get("nodes", "node_1"))
+        cache.put("nodes", "node_3", {"node_uid": "node_3"})
+
+        self.assertIn(("nodes", "node_1"), cache)
+        self.assertNotIn(("nodes", "node_2"), cache)
+        self.assertIn(("nodes", "node_3"), cache)
+
+    def test_disabled(self):
+        """A cache with maxsize 0 does not store anything"""
+        cache = _DocumentCache(maxsize=0)
+        cache.put("nodes", "node_1", {"node_uid": "node_1"})
+        self.assertIsNone(cache.get("nodes", "node_1"))
+
+    def test_invalidate(self):
+        """Invalidated documents are dropped, other collections are not affected"""
+        cache = _DocumentCache(maxsize=10)
+        cache.put("nodes", "node_1", {"node_uid": "node_1"})
+        cache.put("nodes", "node_2", {"node_uid": "node_2"})
+        cache.put("edges", "node_1", {"source_uid": "node_1"})
+
+        cache.invalidate("nodes", "node_1", "node_2", "not_cached")
+
+        self.assertIsNone(cache.get("nodes", "node_1"))
+        self.assertIsNone(cache.get("nodes", "node_2"))
+        self.assertEqual(cache.get("edges", "node_1"), {"source_uid": "node_1"})
+
+        cache.clear()
+        self.assertIsNone(cache.get("edges", "node_1"))
+
+    def test_read_through_race(self):
+        """A read-through started before a write is not cached after the write invalidated the document"""
+        cache = _DocumentCache(maxsize=10)
+
+        # thread A misses the cache and reads the old document
+        self.assertIsNone(cache.get("nodes", "node_1"))
+        generation = cache.generation()
+        old_doc_dict = {"node_uid": "node_1", "node_title": "A"}
+
+        # thread B writes the document, invalidating it before and after the write
+        cache.invalidate("nodes", "node_1")
+        cache.invalidate("nodes", "node_1")
+
+        # thread A stores the old document, which is dropped
+        cache.put("nodes", "node_1", old_doc_dict, generation=generation)
+        self.assertIsNone(cache.get("nodes", "node_1"))
+
+        # a read-through started after the write is cached again
+        generation = cache.generation()
+        cache.put("nodes", "node_1", {"node_uid": "node_1", "node_title": "B"}, generation=generation)
+        self.assertEqual(cache.get("nodes", "node_1"), {"node_uid": "node_1", "node_title": "B"})
+
+    def test_copy_isolation(self):
+        """Modifying stored or returned document data does not change the cached entry"""
+        cache = _DocumentCache(maxsize=10)
+        doc_dict = {"node_uid": "node_1", "edges_to": ["node_2"]}
+        cache.put("nodes", "node_1", doc_dict)
+        doc_dict["edges_to"].append("node_3")
+
+        cached_dict = cache.get("nodes", "node_1")
+        self.assertEqual(cached_dict, {"node_uid": "node_1", "edges_to": ["node_2"]})
+        cached_dict["edges_to"].append("node_4")  # type: ignore
+        self.assertEqual(cache.get("nodes", "node_1"),
+                         {"node_uid": "node_1", "edges_to": ["node_2"]})
+
+        # NodeData.__from_dict__ copies the values of an uncopied cache entry itself
+        node_data = NodeData.__from_dict__(
+            cache.get("nodes", "node_1", copy_data=False) | {
+                "node_title": "Test Node 1", "node_type": "Person",
+                "node_description": "This is a test node", "node_degree": 0,
+                "document_id": "doc_1"})
+        node_data.edges_to.append("node_5")
+        self.assertEqual(cache.get("nodes", "node_1"),
+                         {"node_uid": "node_1", "edges_to": ["node_2"]})
+
+
+class NodeDataChangeTrackingTests(unittest.TestCase):
+    """Test cases for the changed field detection of NodeData used by update_node, no database required."""
+
+    def _loaded_node(self) -> NodeData:
+        return NodeData.__from_dict__({
+            "node_uid": "test_node_1",
+            "node_title": "A",
+            "node_type": "Person",
+            "node_description": "This is a test node",
+            "node_degree": 0,
+            "document_id": "doc_1",
+            "edges_to": [],
+            "edges_from": [],
+            "embedding": [0.1, 0.2, 0.3],
+        })
+
+    def test_update_revert_update(self):
+        """Reverting a saved change is detected as a change again"""
+        node_data = self._loaded_node()
+        self.assertEqual(node_data._changed_fields("test_node_1"), {})
+
+        node_data.node_title = "B"
+        changed = node_data._changed_fields("test_node_1")
+        self.assertEqual(changed, {"node_title": "B"})
+        node_data._mark_saved(changed)
+        self.assertEqual(node_data._changed_fields("test_node_1"), {})
+
+        node_data.node_title = "A"
+        changed = node_data._changed_fields("test_node_1")
+        self.assertEqual(changed, {"node_title": "A"})
+        node_data._mark_saved(changed)
+        self.assertEqual(node_data._changed_fields("test_node_1"), {})
+
+    def test_in_place_change(self):
+        """In-place changes of list fields are detected and not shared with the saved state"""
+        node_data = self._loaded_node()
+        node_data.edges_to.append("test_node_2")
+        changed = node_data._changed_fields("test_node_1")
+        self.assertEqual(changed, {"edges_to": ["test_node_2"]})
+        node_data._mark_saved(changed)
+
+        node_data.edges_to.append("test_node_3")
+        self.assertEqual(node_data._changed_fields("test_node_1"),
+                         {"edges_to": ["test_node_2", "test_node_3"]})
+
+    def test_other_node_uid(self):
+        """All fields are returned for a node that was not loaded or loaded for another node_uid"""
+        node_data = self._loaded_node()
+        self.assertEqual(node_data._changed_fields("test_node_2"), node_data.__to_dict__())
+
+        new_node_data = NodeData(**node_data.__to_dict__())
+        self.assertEqual(new_node_data._changed_fields("test_node_1"), new_node_data.__to_dict__())
+
 
 class AuraKGTest(_NoSQLKnowledgeGraphTests, unittest.TestCase):
     """
@@ -837,6 +1062,8 @@ def suite():
     """testing suite def"""
     suite = unittest.TestSuite()
     suite.addTest(unittest.makeSuite(FirestoreKGTests))
+    suite.addTest(unittest.makeSuite(DocumentCacheTests))
+    suite.addTest(unittest.makeSuite(NodeDataChangeTrackingTests))
     suite.addTest(unittest.makeSuite(AuraKGTest))
     suite.addTest(unittest.makeSuite(MongoKGTest))
     # Add tests for other database classes as needed
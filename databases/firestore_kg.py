@@ -1,11 +1,17 @@
 """Firestore database operations implementation"""
 
-from typing import List
-
-import firebase_admin  # type: ignore
-from firebase_admin import firestore
+import copy
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from google.cloud import firestore
+from google.api_core.exceptions import AlreadyExists, NotFound
+from google.cloud.firestore_v1.base_query import FieldFilter
 from google.cloud.firestore_v1.base_vector_query import DistanceMeasure
 from google.cloud.firestore_v1.vector import Vector
+from google.rpc import code_pb2
 import google.auth
 
 import networkx as nx  # type: ignore
@@ -14,15 +20,96 @@ from datamodel.data_model import NodeData, EdgeData, CommunityData
 from base.operations import NoSQLKnowledgeGraph
 
 
+class _DocumentCache:
+    """
+    In-process LRU cache of Firestore document data keyed by (collection_id, document_id).
+    Entries are only invalidated by writes of this process, writes of other clients are not seen.
+    Access is guarded by a lock, so the cache can be shared by threads using the same FirestoreKG.
+    Every invalidation bumps a generation counter, a read-through put() started before an
+    invalidation is dropped, so a concurrent read can't re-insert data that is being overwritten.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._docs: OrderedDict[tuple[str, str], dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def generation(self) -> int:
+        """Returns the current generation, take it before reading the document to put()."""
+        with self._lock:
+            return self._generation
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        with self._lock:
+            return key in self._docs
+
+    def get(self, collection_id: str, doc_id: str, copy_data: bool = True) -> dict | None:
+        """
+        Returns the cached document data or None on a cache miss.
+        Pass copy_data=False if the caller copies the values itself and never modifies the returned dict.
+        """
+        key = (collection_id, doc_id)
+        with self._lock:
+            if key not in self._docs:
+                return None
+            self._docs.move_to_end(key)
+            doc_dict = self._docs[key]
+        return copy.deepcopy(doc_dict) if copy_data else doc_dict
+
+    def put(self, collection_id: str, doc_id: str, doc_dict: dict, generation: int | None = None) -> None:
+        """
+        Stores a copy of the document data, evicting the least recently used entries.
+        If generation is given, nothing is stored if the cache was invalidated since.
+        """
+        if self.maxsize <= 0:
+            return
+        key = (collection_id, doc_id)
+        doc_dict = copy.deepcopy(doc_dict)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._docs[key] = doc_dict
+            self._docs.move_to_end(key)
+            while len(self._docs) > self.maxsize:
+                self._docs.popitem(last=False)
+
+    def invalidate(self, collection_id: str, *doc_ids: str) -> None:
+        """Drops the given documents from the cache."""
+        with self._lock:
+            self._generation += 1
+            for doc_id in doc_ids:
+                self._docs.pop((collection_id, doc_id), None)
+
+    def clear(self) -> None:
+        """Drops all cached documents."""
+        with self._lock:
+            self._generation += 1
+            self._docs.clear()
+
+
 class FirestoreKG(NoSQLKnowledgeGraph):
     """Firestore database operations implementation class"""
 
+    # node fields transferred when building the networkx representation
+    _NETWORKX_NODE_FIELDS = ["node_uid", "node_title", "node_type",
+                             "node_description", "node_degree", "document_id", "community_id"]
+
+    # attempts per BulkWriter write before it counts as failed, same as the BulkWriter default
+    _BULK_WRITE_MAX_ATTEMPTS = 15
+
+    # transient gRPC status codes worth retrying, other errors like NOT_FOUND fail right away
+    _BULK_WRITE_RETRYABLE_CODES = frozenset([
+        code_pb2.ABORTED, code_pb2.DEADLINE_EXCEEDED, code_pb2.INTERNAL,
+        code_pb2.RESOURCE_EXHAUSTED, code_pb2.UNAVAILABLE])
+
     def __init__(
         self,
         firestore_client,
         node_collection_id: str,
         edges_collection_id: str,
-        community_collection_id: str
+        community_collection_id: str,
+        cache_size: int = 0
     ) -> None:
         """
         Initializes the FirestoreKG object.
@@ -31,6 +118,9 @@ class FirestoreKG(NoSQLKnowledgeGraph):
             project_id (str): The Google Cloud project ID.
             database_id (str): The ID of the Firestore database.
             collection_name (str): The name of the collection to store the KG.
+            cache_size (int): Max number of documents kept in the in-process read cache
+                of get_node, get_edge and get_community. Disabled by default (0), only enable it
+                if no other client writes to the same database, their writes are not seen by the cache.
         """
         super().__init__()
 
@@ -38,6 +128,7 @@ class FirestoreKG(NoSQLKnowledgeGraph):
         self.node_coll_id = node_collection_id
         self.edges_coll_id = edges_collection_id
         self.community_coll_id = community_collection_id
+        self._doc_cache = _DocumentCache(maxsize=cache_size)
 
     @classmethod
     def from_app(
@@ -47,7 +138,8 @@ class FirestoreKG(NoSQLKnowledgeGraph):
         firestore_db_id: str,
         node_collection_id: str,
         edges_collection_id: str,
-        community_collection_id: str
+        community_collection_id: str,
+        cache_size: int = 0
     ):
         """
         Args:
@@ -55,12 +147,6 @@ class FirestoreKG(NoSQLKnowledgeGraph):
             database_id (str): The ID of the Firestore database.
             collection_name (str): The name of the collection to store the KG.
         """
-        if not firebase_admin._apps:
-            credentials = firebase_admin.credentials.Certificate(
-                gcp_credential_file
-            )
-            app = firebase_admin.initialize_app(credentials)
-            
         credentials, gcp_project_id = google.auth.load_credentials_from_file(
             gcp_credential_file
         )
@@ -76,17 +162,13 @@ class FirestoreKG(NoSQLKnowledgeGraph):
             node_collection_id=node_collection_id,
             edges_collection_id=edges_collection_id,
             community_collection_id=community_collection_id,
+            cache_size=cache_size,
         )
     
     def add_node(self, node_uid: str, node_data: NodeData) -> None:
         """Adds an node to the knowledge graph."""
         doc_ref = self.db.collection(self.node_coll_id).document(node_uid)
 
-        # Check if a node with the same node_uid already exists
-        if doc_ref.get().exists:
-            raise ValueError(
-                f"Error: Node with node_uid '{node_uid}' already exists.")
-
         # block NodeData if edge info is included
         if node_data.edges_to or node_data.edges_from:
             raise ValueError(
@@ -94,49 +176,32 @@ class FirestoreKG(NoSQLKnowledgeGraph):
 
         # Convert NodeData to a dictionary for Firestore storage
         try:
-            node_data_dict = node_data.__dict__
+            node_data_dict = node_data.__to_dict__()
         except TypeError as e:
             raise ValueError(
                 f"Error: Provided node_data for node_uid '{node_uid}' cannot be converted to a dictionary. Details: {e}"
             ) from e
 
-        # Set the document ID to match the node_uid
+        # Create the document with the node_uid as ID, fails if it already exists
         try:
-            doc_ref.set(node_data_dict)
+            doc_ref.create(node_data_dict)
+        except AlreadyExists as e:
+            raise ValueError(
+                f"Error: Node with node_uid '{node_uid}' already exists.") from e
         except ValueError as e:
             raise ValueError(
                 f"Error: Could not add node with node_uid '{node_uid}' to Firestore. Details: {e}"
             ) from e
 
-        # Update references in other nodes
-        for other_node_uid in node_data.edges_to:
-            try:
-                other_node_data = self.get_node(other_node_uid)
-                other_node_data.edges_from = list(set(other_node_data.edges_from) | {
-                                                  node_uid})  # Add to edges_from
-                self.update_node(other_node_uid, other_node_data)
-            except KeyError:
-                # If the other node doesn't exist, just continue
-                continue
-
-        for other_node_uid in node_data.edges_from:
-            try:
-                other_node_data = self.get_node(other_node_uid)
-                other_node_data.edges_to = list(set(other_node_data.edges_from) | {
-                                                node_uid})  # Add to edges_to
-                self.update_node(other_node_uid, other_node_data)
-            except KeyError:
-                # If the other node doesn't exist, just continue
-                continue
-
     def get_node(self, node_uid: str) -> NodeData:
         """Retrieves an node from the knowledge graph."""
-        doc_ref = self.db.collection(self.node_coll_id).document(node_uid)
-        doc_snapshot = doc_ref.get()
+        # NodeData.__from_dict__ copies the field values itself
+        node_data_dict = self._get_doc_dict(
+            self.node_coll_id, node_uid, copy_data=False)
 
-        if doc_snapshot.exists:
+        if node_data_dict is not None:
             try:
-                node_data = NodeData(**doc_snapshot.to_dict())
+                node_data = NodeData.__from_dict__(node_data_dict)
                 return node_data
             except TypeError as e:
                 raise ValueError(
@@ -149,70 +214,88 @@ class FirestoreKG(NoSQLKnowledgeGraph):
         """Updates an existing node in the knowledge graph."""
         doc_ref = self.db.collection(self.node_coll_id).document(node_uid)
 
-        # Check if the node exists
-        if not doc_ref.get().exists:
-            raise KeyError(
-                f"Error: Node with node_uid '{node_uid}' does not exist.")
-
-        # Convert NodeData to a dictionary for Firestore storage
+        # Only send the fields that changed since the node was fetched or last updated
         try:
-            node_data_dict = node_data.__dict__
+            node_data_dict = node_data._changed_fields(node_uid)
         except TypeError as e:
             raise ValueError(
                 f"Error: Provided node_data for node_uid '{node_uid}' cannot be converted to a dictionary. Details: {e}"
             ) from e
 
-        # Update the document
+        # Nothing to write, updating a missing node still fails
+        if not node_data_dict:
+            if not self.node_exist(node_uid):
+                raise KeyError(
+                    f"Error: Node with node_uid '{node_uid}' does not exist.")
+            return None
+
+        # Update the document, fails if the node does not exist
         try:
-            doc_ref.update(node_data_dict)
+            with self._invalidating(self.node_coll_id, node_uid):
+                doc_ref.update(node_data_dict)
+        except NotFound as e:
+            raise KeyError(
+                f"Error: Node with node_uid '{node_uid}' does not exist.") from e
         except ValueError as e:
             raise ValueError(
                 f"Error: Could not update node with node_uid '{node_uid}' in Firestore. Details: {e}"
             ) from e
 
+        # The written values are the new baseline for changes to node_data
+        if node_data.node_uid == node_uid:
+            node_data._mark_saved(node_data_dict)
+
     def remove_node(self, node_uid: str) -> None:
         """
         Removes an node from the knowledge graph.
-        Also removed all edges to and from the node to be removed from all other nodes.
+        Also removed all edges to and from the node to be removed from all other nodes
+        and from the edges collection.
         """
         doc_ref = self.db.collection(self.node_coll_id).document(node_uid)
 
-        # TODO: Update edge collection on edge removal.
-
-        # Check if the node exists
-        if not doc_ref.get().exists:
-            raise KeyError(
-                f"Error: Node with node_uid '{node_uid}' does not exist.")
-
-        # 1. Get the node data to find its connections
-        node_data = self.get_node(node_uid)
-
-        # 2. Remove connections TO this node from other nodes
-        for other_node_uid in node_data.edges_from:
-            try:
-                other_node_data = self.get_node(other_node_uid)
-                other_node_data.edges_to = list(
-                    edge for edge in other_node_data.edges_to if edge != node_uid
-                )
-                self.update_node(other_node_uid, other_node_data)
-            except KeyError:
-                # If the other node doesn't exist, just continue
-                continue
-
-        # 3. Remove connections FROM this node to other nodes
-        for other_node_uid in node_data.edges_to:
-            try:
-                other_node_data = self.get_node(other_node_uid)
-                other_node_data.edges_from = list(
-                    edge for edge in other_node_data.edges_from if edge != node_uid
-                )
-                self.update_node(other_node_uid, other_node_data)
-            except KeyError:
-                # If the other node doesn't exist, just continue
-                continue
-
-        # 4. Finally, remove the node itself
-        doc_ref.delete()
+        # 1. Get the node's connections
+        doc_snapshot = doc_ref.get(field_paths=["edges_to", "edges_from"])
+        if not doc_snapshot.exists:
+            raise KeyError(f"Error: No node found with node_uid: {node_uid}")
+        node_edges = doc_snapshot.to_dict()
+
+        # 2. Collect the back-references to remove from other nodes
+        neighbour_updates: dict[str, dict] = {}
+        for other_node_uid in node_edges.get("edges_from", []):
+            neighbour_updates.setdefault(other_node_uid, {})[
+                "edges_to"] = firestore.ArrayRemove([node_uid])
+        for other_node_uid in node_edges.get("edges_to", []):
+            neighbour_updates.setdefault(other_node_uid, {})[
+                "edges_from"] = firestore.ArrayRemove([node_uid])
+        neighbour_updates.pop(node_uid, None)
+
+        # 3. Fetch all neighbours at once and skip the ones that don't exist
+        neighbour_snapshots = self._get_node_snapshots(
+            list(neighbour_updates), field_paths=[])
+
+        # 4. Find the edge records of the node
+        edges_coll = self.db.collection(self.edges_coll_id)
+        edge_refs = [edge_doc.reference
+                     for field in ["source_uid", "target_uid"]
+                     for edge_doc in edges_coll.where(
+                         filter=FieldFilter(field, "==", node_uid)).select([]).stream()]
+
+        with self._invalidating(self.node_coll_id, node_uid, *neighbour_updates), \
+                self._invalidating(self.edges_coll_id, *[edge_ref.id for edge_ref in edge_refs]):
+            # 5. Remove connections and edge records with parallel batched commits
+            bulk_writer, write_failures = self._bulk_writer()
+            for other_node_uid, update in neighbour_updates.items():
+                if neighbour_snapshots[other_node_uid].exists:
+                    bulk_writer.update(
+                        neighbour_snapshots[other_node_uid].reference, update)
+            for edge_ref in edge_refs:
+                bulk_writer.delete(edge_ref)
+            bulk_writer.close()
+            self._raise_on_write_failures(
+                write_failures, f"clean up the connections of node with node_uid '{node_uid}'")
+
+            # 6. Only remove the node itself once its connections are gone, so a failed call can be retried
+            doc_ref.delete()
 
     def add_edge(self, edge_data: EdgeData) -> None:
         """
@@ -225,14 +308,6 @@ class FirestoreKG(NoSQLKnowledgeGraph):
             directed (bool, optional): Whether the edge is directed. Defaults to True.
         """
 
-        # Check if source and target nodes exist
-        if not self.get_node(edge_data.source_uid):
-            raise KeyError(
-                f"Error: Source node with node_uid '{edge_data.source_uid}' does not exist.")
-        if not self.get_node(edge_data.target_uid):
-            raise KeyError(
-                f"Error: Target node with node_uid '{edge_data.target_uid}' does not exist.")
-
         # Type checking for edge_data
         if not isinstance(edge_data, EdgeData):
             raise TypeError(
@@ -241,36 +316,44 @@ class FirestoreKG(NoSQLKnowledgeGraph):
         edge_uid = self._generate_edge_uid(
             source_uid=edge_data.source_uid, target_uid=edge_data.target_uid)
 
-        try:
-            source_node_data = self.get_node(edge_data.source_uid)
-            target_node_data = self.get_node(edge_data.target_uid)
-
-            source_node_data.edges_to = list(
-                set(source_node_data.edges_to) | {edge_data.target_uid})
-            self.update_node(edge_data.source_uid, source_node_data)
-
-            # Add the edge to the target node's edges_from
-            target_node_data.edges_from = list(
-                set(target_node_data.edges_from) | {edge_data.source_uid})
-            self.update_node(edge_data.target_uid, target_node_data)
+        # Add the edge to the source's edges_to and the target's edges_from
+        source_update = {
+            "edges_to": firestore.ArrayUnion([edge_data.target_uid])}
+        target_update = {
+            "edges_from": firestore.ArrayUnion([edge_data.source_uid])}
+
+        if not edge_data.directed:  # If undirected, add the reverse direction as well
+            source_update["edges_from"] = firestore.ArrayUnion(
+                [edge_data.target_uid])
+            target_update["edges_to"] = firestore.ArrayUnion(
+                [edge_data.source_uid])
+
+        @firestore.transactional
+        def _add_edge_txn(transaction) -> None:
+            # Check if source and target nodes exist
+            node_snapshots = self._get_node_snapshots(
+                [edge_data.source_uid, edge_data.target_uid], field_paths=[], transaction=transaction)
+            if not node_snapshots[edge_data.source_uid].exists:
+                raise KeyError(
+                    f"Error: Source node with node_uid '{edge_data.source_uid}' does not exist.")
+            if not node_snapshots[edge_data.target_uid].exists:
+                raise KeyError(
+                    f"Error: Target node with node_uid '{edge_data.target_uid}' does not exist.")
+
+            transaction.update(
+                node_snapshots[edge_data.source_uid].reference, source_update)
+            transaction.update(
+                node_snapshots[edge_data.target_uid].reference, target_update)
 
             # Add the edge to the edges collection
             self._update_egde_coll(edge_uid=edge_uid,
                                    target_uid=edge_data.target_uid,
                                    source_uid=edge_data.source_uid,
                                    description=edge_data.description,
-                                   directed=edge_data.directed)
-
-            if not edge_data.directed:  # If undirected, add the reverse edge as well
-                target_node_data.edges_to = list(
-                    set(target_node_data.edges_to) | {edge_data.source_uid})
-                self.update_node(edge_data.target_uid, target_node_data)
-
-                # Since it's undirected, also add source_uid to target_node_data.edges_from
-                source_node_data.edges_from = list(
-                    set(source_node_data.edges_from) | {edge_data.target_uid})
-                self.update_node(edge_data.source_uid, source_node_data)
+                                   directed=edge_data.directed,
+                                   batch=transaction)
 
+            if not edge_data.directed:
                 # Add the reverse edge to the edges collection
                 reverse_edge_uid = self._generate_edge_uid(source_uid=edge_data.target_uid,
                                                            target_uid=edge_data.source_uid)
@@ -278,8 +361,15 @@ class FirestoreKG(NoSQLKnowledgeGraph):
                                        target_uid=edge_data.source_uid,
                                        source_uid=edge_data.target_uid,
                                        description=edge_data.description,
-                                       directed=edge_data.directed)
+                                       directed=edge_data.directed,
+                                       batch=transaction)
 
+        try:
+            with self._invalidating(self.node_coll_id, edge_data.source_uid, edge_data.target_uid), \
+                    self._invalidating(self.edges_coll_id, edge_uid,
+                                       self._generate_edge_uid(edge_data.target_uid, edge_data.source_uid)):
+                # existence checks and all writes are committed atomically in one RPC
+                _add_edge_txn(self.db.transaction())
         except ValueError as e:
             raise ValueError(
                 f"Error: Could not add edge from '{edge_data.source_uid}' to '{edge_data.target_uid}'. Details: {e}"
@@ -288,13 +378,11 @@ class FirestoreKG(NoSQLKnowledgeGraph):
     def get_edge(self, source_uid: str, target_uid: str) -> EdgeData:
         """Retrieves an edge between two entities from the edges collection."""
         edge_uid = self._generate_edge_uid(source_uid, target_uid)
-        edge_doc_ref = self.db.collection(
-            self.edges_coll_id).document(edge_uid)
-        doc_snapshot = edge_doc_ref.get()
+        edge_data_dict = self._get_doc_dict(self.edges_coll_id, edge_uid)
 
-        if doc_snapshot.exists:
+        if edge_data_dict is not None:
             try:
-                edge_data = EdgeData(**doc_snapshot.to_dict())
+                edge_data = EdgeData(**edge_data_dict)
                 return edge_data
             except TypeError as e:
                 raise ValueError(
@@ -314,114 +402,98 @@ class FirestoreKG(NoSQLKnowledgeGraph):
         edge_uid = self._generate_edge_uid(
             edge_data.source_uid, edge_data.target_uid)
 
-        if not self.db.collection(self.edges_coll_id).document(edge_uid).get().exists:
+        if not self.db.collection(self.edges_coll_id).document(edge_uid).get(field_paths=[]).exists:
             raise KeyError(
                 f"Error: Edge with edge_uid '{edge_uid}' does not exist.")
 
+        batch = self.db.batch()
+
         # 2. Update the edge document in the EDGES collection
-        try:
-            self._update_egde_coll(
-                edge_uid=edge_uid,
-                target_uid=edge_data.target_uid,
-                source_uid=edge_data.source_uid,
-                description=edge_data.description,
-                directed=edge_data.directed
-            )
-        except Exception as e:
-            raise Exception(
-                f"Error updating edge in edges collection: {e}") from e
+        self._update_egde_coll(
+            edge_uid=edge_uid,
+            target_uid=edge_data.target_uid,
+            source_uid=edge_data.source_uid,
+            description=edge_data.description,
+            directed=edge_data.directed,
+            batch=batch
+        )
 
-        # 3. Update edge references in the NODES collection
-        try:
-            # 3a. Update source node
-            source_node_data = self.get_node(edge_data.source_uid)
-            # Ensure the target_uid is present in edges_to
-            if edge_data.target_uid not in source_node_data.edges_to:
-                source_node_data.edges_to = list(
-                    set(source_node_data.edges_to) | {edge_data.target_uid})
-                self.update_node(edge_data.source_uid, source_node_data)
-
-            # 3b. Update target node
-            target_node_data = self.get_node(edge_data.target_uid)
-            # Ensure the source_uid is present in edges_from
-            if edge_data.source_uid not in target_node_data.edges_from:
-                target_node_data.edges_from = list(
-                    set(target_node_data.edges_from) | {edge_data.source_uid})
-                self.update_node(edge_data.target_uid, target_node_data)
+        # 3. Ensure edge references in the NODES collection, no-op if already present
+        node_coll = self.db.collection(self.node_coll_id)
+        batch.update(node_coll.document(edge_data.source_uid),
+                     {"edges_to": firestore.ArrayUnion([edge_data.target_uid])})
+        batch.update(node_coll.document(edge_data.target_uid),
+                     {"edges_from": firestore.ArrayUnion([edge_data.source_uid])})
 
+        try:
+            with self._invalidating(self.node_coll_id, edge_data.source_uid, edge_data.target_uid), \
+                    self._invalidating(self.edges_coll_id, edge_uid):
+                batch.commit()
         except Exception as e:
             raise Exception(
-                f"Error updating edge references in nodes: {e}") from e
+                f"Error updating edge '{edge_uid}': {e}") from e
 
-    def _delete_from_edge_coll(self, edge_uid: str) -> None:
+    def _delete_from_edge_coll(self, edge_uid: str, batch=None) -> None:
         """Method to delete record from edge collection of given kg store"""
         edge_doc_ref = self.db.collection(
             self.edges_coll_id).document(edge_uid)
-        edge_doc_ref.delete()
+        # a queued write is committed by the caller, which invalidates the edge again afterwards
+        with self._invalidating(self.edges_coll_id, edge_uid):
+            if batch is not None:
+                batch.delete(edge_doc_ref)
+            else:
+                edge_doc_ref.delete()
 
     def remove_edge(self, source_uid: str, target_uid: str) -> None:
         """Removes an edge between two entities."""
 
-        # Get involved edge and node data
-        try:
-            edge_data = self.get_edge(
-                source_uid=source_uid, target_uid=target_uid)
-        except Exception as e:
-            raise Exception(f"Error getting edge: {e}") from e
-
-        try:
-            source_node_data = self.get_node(node_uid=source_uid)
-        except Exception as e:
-            raise Exception(f"Error getting source node: {e}") from e
-
-        try:
-            target_node_data = self.get_node(node_uid=target_uid)
-        except Exception as e:
-            raise Exception(f"Error getting target node: {e}") from e
-
-        # remove target_uid from from source -> target
-        try:
-            source_node_data.edges_to.remove(target_uid)
-            self.update_node(source_uid, source_node_data)
-        except ValueError as e:
-            raise ValueError(
-                f"Error: Target node not in source's edges_to: {e}")
-
-        # remove source_uid from target <- source
-        try:
-            target_node_data.edges_from.remove(source_uid)
-            self.update_node(target_uid, target_node_data)
-        except ValueError as e:
-            raise ValueError(
-                f"Error: Source node not in target's edges_to: {e}")
-
-        # Remove the edge from the edges collection
         edge_uid = self._generate_edge_uid(source_uid, target_uid)
-        self._delete_from_edge_coll(edge_uid=edge_uid)
-
-        # remove the opposite direction if edge undirected
-        if not edge_data.directed:
-            # remove target_uid from source <- target
-            try:
-                source_node_data.edges_from.remove(target_uid)
-                self.update_node(source_uid, source_node_data)
-            except ValueError as e:
-                raise ValueError(
-                    f"Error: Target node not in source's edges_to: {e}")
-
-            # remove source_uid from target -> source
-            try:
-                target_node_data.edges_to.remove(source_uid)
-                self.update_node(target_uid, target_node_data)
-            except ValueError as e:
-                raise ValueError(
-                    f"Error: Source node not in target's edges_to: {e}")
+        node_coll = self.db.collection(self.node_coll_id)
+
+        @firestore.transactional
+        def _remove_edge_txn(transaction) -> None:
+            # Get the edge direction and check both nodes exist with a single batched read
+            edge_snapshot, source_snapshot, target_snapshot = self._get_snapshots([
+                self.db.collection(self.edges_coll_id).document(edge_uid),
+                node_coll.document(source_uid),
+                node_coll.document(target_uid)
+            ], field_paths=["directed"], transaction=transaction)
+
+            if not edge_snapshot.exists:
+                raise KeyError(
+                    f"Error getting edge: No edge found with edge_uid: {edge_uid}")
+            if not source_snapshot.exists:
+                raise KeyError(
+                    f"Error getting source node: No node found with node_uid: {source_uid}")
+            if not target_snapshot.exists:
+                raise KeyError(
+                    f"Error getting target node: No node found with node_uid: {target_uid}")
+
+            # remove target_uid from source -> target and source_uid from target <- source
+            source_update = {"edges_to": firestore.ArrayRemove([target_uid])}
+            target_update = {"edges_from": firestore.ArrayRemove([source_uid])}
+
+            directed = edge_snapshot.to_dict().get("directed", True)
+            if not directed:  # remove the opposite direction if edge undirected
+                source_update["edges_from"] = firestore.ArrayRemove(
+                    [target_uid])
+                target_update["edges_to"] = firestore.ArrayRemove([source_uid])
+
+            transaction.update(source_snapshot.reference, source_update)
+            transaction.update(target_snapshot.reference, target_update)
 
             # Remove the edge from the edges collection
-            reverse_edge_uid = self._generate_edge_uid(target_uid, source_uid)
-            self._delete_from_edge_coll(edge_uid=reverse_edge_uid)
-        else:
-            pass
+            self._delete_from_edge_coll(edge_uid=edge_uid, batch=transaction)
+            if not directed:
+                reverse_edge_uid = self._generate_edge_uid(
+                    target_uid, source_uid)
+                self._delete_from_edge_coll(
+                    edge_uid=reverse_edge_uid, batch=transaction)
+
+        with self._invalidating(self.node_coll_id, source_uid, target_uid), \
+                self._invalidating(self.edges_coll_id, edge_uid,
+                                   self._generate_edge_uid(target_uid, source_uid)):
+            _remove_edge_txn(self.db.transaction())
 
     def build_networkx(self):
         """Get the NetworkX representation of the full graph."""
@@ -429,17 +501,21 @@ class FirestoreKG(NoSQLKnowledgeGraph):
         graph = nx.Graph()  # Initialize an undirected NetworkX graph
 
         # 1. Add Nodes to the NetworkX Graph
-        nodes_ref = self.db.collection(self.node_coll_id).stream()
+        # Only scalar node attributes are needed (e.g. node_type for visualize_graph),
+        # embeddings and edge lists are left on the server.
+        nodes_ref = self.db.collection(self.node_coll_id).select(
+            self._NETWORKX_NODE_FIELDS).stream()
         for doc in nodes_ref:
             node_data = doc.to_dict()
             graph.add_node(doc.id, **node_data)
 
         # 2. Add Edges to the NetworkX Graph
-        edges_ref = self.db.collection(self.edges_coll_id).stream()
+        edges_ref = self.db.collection(self.edges_coll_id).select(
+            ["source_uid", "target_uid"]).stream()
         for doc in edges_ref:
-            edge_data = doc.to_dict()
-            source_uid = edge_data['source_uid']
-            target_uid = edge_data['target_uid']
+            # Read the two fields directly instead of copying the snapshot via to_dict()
+            source_uid = doc.get("source_uid")
+            target_uid = doc.get("target_uid")
             # Consider adding edge attributes if needed (e.g., 'description')
             graph.add_edge(source_uid, target_uid)
 
@@ -447,13 +523,12 @@ class FirestoreKG(NoSQLKnowledgeGraph):
 
     def get_community(self, community_id: str) -> CommunityData:
         """Retrieves the community report for a given community id."""
-        doc_ref = self.db.collection(
-            self.community_coll_id).document(community_id)
-        doc_snapshot = doc_ref.get()
+        community_data_dict = self._get_doc_dict(
+            self.community_coll_id, community_id)
 
-        if doc_snapshot.exists:
+        if community_data_dict is not None:
             try:
-                community_data = CommunityData(**doc_snapshot.to_dict())
+                community_data = CommunityData(**community_data_dict)
                 return community_data
             except TypeError as e:
                 raise ValueError(
@@ -463,13 +538,17 @@ class FirestoreKG(NoSQLKnowledgeGraph):
             raise KeyError(
                 f"Error: No community found with community_id: {community_id}")
 
-    def list_communities(self) -> List[CommunityData]:
-        """Lists all communities for the given network."""
+    def list_communities(self) -> Iterator[CommunityData]:
+        """Lazily yields all communities for the given network while they are streamed."""
         docs = self.db.collection(self.community_coll_id).stream()
-        return [CommunityData.__from_dict__(doc.to_dict()) for doc in docs]
+        for doc in docs:
+            yield CommunityData.__from_dict__(doc.to_dict())
 
-    def _update_egde_coll(self, edge_uid: str, source_uid: str, target_uid: str, description: str, directed: bool) -> None:
-        """Update edge record in the edges collection."""
+    def _update_egde_coll(self, edge_uid: str, source_uid: str, target_uid: str, description: str, directed: bool,
+                          batch=None) -> None:
+        """Update edge record in the edges collection.
+        If a write batch or transaction is given, the write is queued on it instead of being sent directly.
+        """
         edge_doc_ref = self.db.collection(
             self.edges_coll_id).document(edge_uid)
         edge_data_dict = {
@@ -479,7 +558,12 @@ class FirestoreKG(NoSQLKnowledgeGraph):
             "description": description,
             "directed": directed
         }
-        edge_doc_ref.set(edge_data_dict)
+        # a queued write is committed by the caller, which invalidates the edge again afterwards
+        with self._invalidating(self.edges_coll_id, edge_uid):
+            if batch is not None:
+                batch.set(edge_doc_ref, edge_data_dict)
+            else:
+                edge_doc_ref.set(edge_data_dict)
 
     def store_community(self, community: CommunityData) -> None:
         """Takes valid graph community data and upserts the database with it.
@@ -499,17 +583,100 @@ class FirestoreKG(NoSQLKnowledgeGraph):
 
         # Use set with merge=True to upsert the document
         try:
-            doc_ref.set(community_data_dict, merge=True)
+            with self._invalidating(self.community_coll_id, community.title):
+                doc_ref.set(community_data_dict, merge=True)
         except Exception as e:
             raise Exception(f"Error storing community data: {e}") from e
 
-    def _generate_edge_uid(self, source_uid: str, target_uid: str):
+    def _get_doc_dict(self, collection_id: str, doc_id: str, copy_data: bool = True) -> dict | None:
+        """
+        Read-through lookup of a document's data, returns None if the document does not exist.
+        With copy_data=False a cache hit returns the cached dict itself, which must not be modified.
+        """
+        doc_dict = self._doc_cache.get(collection_id, doc_id, copy_data=copy_data)
+        if doc_dict is None:
+            generation = self._doc_cache.generation()
+            doc_snapshot = self.db.collection(
+                collection_id).document(doc_id).get()
+            if not doc_snapshot.exists:
+                return None
+            doc_dict = doc_snapshot.to_dict()
+            self._doc_cache.put(collection_id, doc_id, doc_dict, generation=generation)
+        return doc_dict
+
+    @contextmanager
+    def _invalidating(self, collection_id: str, *doc_ids: str):
+        """
+        Drops the given documents from the cache before and after the enclosed write, so neither
+        an earlier cached value nor a concurrent read-through of the old document survives it.
+        """
+        self._doc_cache.invalidate(collection_id, *doc_ids)
+        try:
+            yield
+        finally:
+            self._doc_cache.invalidate(collection_id, *doc_ids)
+
+    def _get_node_snapshots(self, node_uids: List[str], field_paths: List[str] | None = None,
+                            transaction=None) -> dict:
+        """
+        Fetches the given node documents in a single batched read, keyed by node_uid.
+        Pass field_paths=[] if only the existence of the nodes is of interest.
+        """
+        node_coll = self.db.collection(self.node_coll_id)
+        doc_refs = [node_coll.document(node_uid) for node_uid in node_uids]
+        return dict(zip(node_uids, self._get_snapshots(doc_refs, field_paths=field_paths,
+                                                       transaction=transaction)))
+
+    def _get_snapshots(self, doc_refs: list, field_paths: List[str] | None = None,
+                       transaction=None) -> list:
+        """
+        Fetches the given documents in a single batched read instead of one round-trip per document.
+        Snapshots are returned in the order of doc_refs, get_all itself does not guarantee any order.
+        """
+        if not doc_refs:
+            return []
+        snapshots = {snapshot.reference.path: snapshot
+                     for snapshot in self.db.get_all(doc_refs, field_paths=field_paths,
+                                                     transaction=transaction)}
+        return [snapshots[doc_ref.path] for doc_ref in doc_refs]
+
+    def _bulk_writer(self) -> tuple:
+        """
+        Creates a BulkWriter together with the list its permanently failed writes are collected in.
+        BulkWriter.close() does not raise for failed writes, pass the list to _raise_on_write_failures.
+        """
+        write_failures: list = []
+
+        def on_write_error(error, bulk_writer) -> bool:
+            # retry transient errors only, record the write once it gives up
+            if (error.code in self._BULK_WRITE_RETRYABLE_CODES
+                    and error.attempts < self._BULK_WRITE_MAX_ATTEMPTS):
+                return True
+            write_failures.append(error)
+            return False
+
+        bulk_writer = self.db.bulk_writer()
+        bulk_writer.on_write_error(on_write_error)
+        return bulk_writer, write_failures
+
+    def _raise_on_write_failures(self, write_failures: list, action: str) -> None:
+        """Raises if any write of a closed BulkWriter failed."""
+        if write_failures:
+            details = "; ".join(
+                f"{failure.operation.reference.path}: {failure.message}" for failure in write_failures)
+            raise Exception(
+                f"Error: Could not {action}, {len(write_failures)} write(s) failed. Details: {details}")
+
+    def _generate_edge_uid(self, source_uid: str, target_uid: str) -> str:
+        """Generates Edge uid for the network based on source and target nod uid"""
         return f"{source_uid}_to_{target_uid}"
 
     def node_exist(self, node_uid: str) -> bool:
         """Checks for node existence and returns boolean"""
+        if (self.node_coll_id, node_uid) in self._doc_cache:
+            return True
         doc_ref = self.db.collection(self.node_coll_id).document(node_uid)
-        doc_snapshot = doc_ref.get()
+        doc_snapshot = doc_ref.get(field_paths=[])  # fetch the document id only
 
         if doc_snapshot.exists:
             return True
@@ -520,52 +687,86 @@ class FirestoreKG(NoSQLKnowledgeGraph):
         """Checks for edge existence and returns boolean"""
         edge_uid = self._generate_edge_uid(
             source_uid=source_uid, target_uid=target_uid)
+        if (self.edges_coll_id, edge_uid) in self._doc_cache:
+            return True
         doc_ref = self.db.collection(self.edges_coll_id).document(edge_uid)
-        doc_snapshot = doc_ref.get()
+        doc_snapshot = doc_ref.get(field_paths=[])  # fetch the document id only
 
         if doc_snapshot.exists:
             return True
         else:
             return False
 
+    def get_incoming(self, node_uid: str) -> List[str]:
+        """
+        Returns the uids of all nodes with an edge pointing to the given node.
+        Answered server-side from the automatic array index on edges_to, only document ids are transferred.
+        """
+        docs = self.db.collection(self.node_coll_id).where(
+            filter=FieldFilter("edges_to", "array_contains", node_uid)).select([]).stream()
+        return [doc.id for doc in docs]
+
+    def get_outgoing(self, node_uid: str) -> List[str]:
+        """
+        Returns the uids of all nodes the given node has an edge to.
+        Read from the edges collection instead of the node's edges_to list, so it also works for dense hub nodes.
+        """
+        docs = self.db.collection(self.edges_coll_id).where(
+            filter=FieldFilter("source_uid", "==", node_uid)).select(["target_uid"]).stream()
+        return [doc.get("target_uid") for doc in docs]
+
     def get_nearest_neighbors(self, query_vec: list[float]) -> list:
         """
         Implements nearest neighbor search based on Firestore embedding index:
         https://firebase.google.com/docs/firestore/vector-search
+
+        Returns the node_uid and distance of each hit, use get_node for the full node data.
         """
 
-        collection = self.db.collection(self.node_coll_id)
+        # Only transfer node_uid instead of the full documents including their embeddings,
+        # the distance result field has to be part of the field mask to be returned
+        query = self.db.collection(self.node_coll_id).select(["node_uid", "distance"])
 
         # Requires vector index
-        nn = collection.find_nearest(
+        nn = query.find_nearest(
             vector_field="embedding",
             query_vector=Vector(query_vec),
             distance_measure=DistanceMeasure.EUCLIDEAN,
-            limit=10).get()
+            limit=10,
+            distance_result_field="distance").get()
         return [n.to_dict() for n in nn]
 
     def clean_zerodegree_nodes(self) -> None:
         """Removes all nodes with degree 0."""
-        nodes_to_remove = []
 
-        # 1. Iterate through all nodes to find those with degree 0
-        nodes_ref = self.db.collection(self.node_coll_id).stream()
-        for doc in nodes_ref:
-            node_data = doc.to_dict()
-            if len(node_data.get('edges_to', [])) + len(node_data.get('edges_from', [])) == 0:
-                nodes_to_remove.append(doc.id)
-
-        # 2. Remove the identified nodes
-        for node_uid in nodes_to_remove:
-            self.remove_node(node_uid)
+        # 1. Query the nodes with degree 0 server-side, i.e. empty edges_to and edges_from
+        nodes_ref = self.db.collection(self.node_coll_id).where(
+            filter=FieldFilter("edges_to", "==", [])).where(
+            filter=FieldFilter("edges_from", "==", [])).select([]).stream()
+
+        # 2. Remove the identified nodes, they have no connections to clean up
+        node_refs = [doc.reference for doc in nodes_ref]
+        with self._invalidating(self.node_coll_id, *[node_ref.id for node_ref in node_refs]):
+            bulk_writer, write_failures = self._bulk_writer()
+            for node_ref in node_refs:
+                bulk_writer.delete(node_ref)
+            bulk_writer.close()
+        self._raise_on_write_failures(write_failures, "remove zero degree nodes")
         return None
 
     def flush_kg(self) -> None:
         """Method to wipe the complete datastore of the knowledge graph"""
-        for collection_id in [self.node_coll_id, self.edges_coll_id, self.community_coll_id]:
-            docs = self.db.collection(collection_id).stream()
-            for doc in docs:
-                doc.reference.delete()
+        # recursive_delete lists document ids only and deletes them via a BulkWriter,
+        # it closes the writer when done, so every collection needs its own one
+        try:
+            for collection_id in [self.node_coll_id, self.edges_coll_id, self.community_coll_id]:
+                bulk_writer, write_failures = self._bulk_writer()
+                self.db.recursive_delete(
+                    self.db.collection(collection_id), bulk_writer=bulk_writer)
+                self._raise_on_write_failures(
+                    write_failures, f"flush collection '{collection_id}'")
+        finally:
+            self._doc_cache.clear()
         return None
 
 
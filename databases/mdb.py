@@ -1,6 +1,6 @@
 """MongoDB Database Operations"""
 
-from typing import List
+from typing import Iterator, List
 
 from pymongo.mongo_client import MongoClient
 from pymongo.server_api import ServerApi
@@ -52,7 +52,7 @@ class MongoKG(NoSQLKnowledgeGraph):
 
         try:
             # Convert NodeData to a dictionary for MongoDB storage
-            node_data_dict = node_data.__dict__
+            node_data_dict = node_data.__to_dict__()
 
             # Insert the node data into the collection
             self.mdb_node_coll.insert_one(node_data_dict)
@@ -86,19 +86,19 @@ class MongoKG(NoSQLKnowledgeGraph):
     def update_node(self, node_uid: str, node_data: NodeData) -> None:
         """Updates an existing node in the knowledge graph."""
         try:
-            # Check if the node exists
-            if not self.mdb_node_coll.find_one({"node_uid": node_uid}):
-                raise KeyError(
-                    f"Error: Node with node_uid '{node_uid}' does not exist.")
-
             # Convert NodeData to a dictionary for MongoDB storage
-            node_data_dict = node_data.__dict__
+            node_data_dict = node_data.__to_dict__()
 
             # Update the node data in the collection
-            self.mdb_node_coll.update_one(
+            update_result = self.mdb_node_coll.update_one(
                 {"node_uid": node_uid}, {"$set": node_data_dict}
             )
 
+            # Check if the node exists
+            if update_result.matched_count == 0:
+                raise KeyError(
+                    f"Error: Node with node_uid '{node_uid}' does not exist.")
+
         except Exception as e:
             raise Exception(
                 f"Error updating node with node_uid '{node_uid}': {e}") from e
@@ -106,39 +106,25 @@ class MongoKG(NoSQLKnowledgeGraph):
     def remove_node(self, node_uid: str) -> None:
         """Removes a node from the knowledge graph."""
 
-        # Check if the node exists
-        if not self.node_exist(node_uid=node_uid):
-            raise KeyError(
-                f"Error: Node with node_uid '{node_uid}' does not exist.")
-
-        # 1. Get the node data to find its connections
+        # 1. Get the node data to find its connections, raises KeyError if missing
         node_data = self.get_node(node_uid)
 
         # TODO: Update edge collection on edge removal.
 
         # 2. Remove connections TO this node from other nodes
-        for other_node_uid in node_data.edges_from:
-            try:
-                other_node_data = self.get_node(other_node_uid)
-                other_node_data.edges_to = list(
-                    edge for edge in other_node_data.edges_to if edge != node_uid
-                )
-                self.update_node(other_node_uid, other_node_data)
-            except KeyError:
-                # If the other node doesn't exist, just continue
-                continue
+        # $pull filters the arrays server-side, non-existing other nodes are simply not matched
+        if node_data.edges_from:
+            self.mdb_node_coll.update_many(
+                {"node_uid": {"$in": node_data.edges_from}},
+                {"$pull": {"edges_to": node_uid}}
+            )
 
         # 3. Remove connections FROM this node to other nodes
-        for other_node_uid in node_data.edges_to:
-            try:
-                other_node_data = self.get_node(other_node_uid)
-                other_node_data.edges_from = list(
-                    edge for edge in other_node_data.edges_from if edge != node_uid
-                )
-                self.update_node(other_node_uid, other_node_data)
-            except KeyError:
-                # If the other node doesn't exist, just continue
-                continue
+        if node_data.edges_to:
+            self.mdb_node_coll.update_many(
+                {"node_uid": {"$in": node_data.edges_to}},
+                {"$pull": {"edges_from": node_uid}}
+            )
 
         # 4. Finally, remove the node itself
         delete_result = self.mdb_node_coll.delete_one({"node_uid": node_uid})
@@ -152,33 +138,34 @@ class MongoKG(NoSQLKnowledgeGraph):
 
         # TODO: consider moving to base class.
 
-        # Check if source and target nodes exist
-        if not self.node_exist(edge_data.source_uid):
-            raise KeyError(
-                f"Error: Source node with node_uid '{edge_data.source_uid}' does not exist.")
-        if not self.node_exist(edge_data.target_uid):
-            raise KeyError(
-                f"Error: Target node with node_uid '{edge_data.target_uid}' does not exist.")
-
         # Type checking for edge_data
         if not isinstance(edge_data, EdgeData):
             raise TypeError(
                 f"Error: edge_data must be of type EdgeData, not {type(edge_data)}")
 
-        edge_uid = self._generate_edge_uid(
-            edge_data.source_uid, edge_data.target_uid)
-
+        # Fetch source and target nodes once, this also checks their existence
         try:
             source_node_data = self.get_node(edge_data.source_uid)
+        except KeyError as e:
+            raise KeyError(
+                f"Error: Source node with node_uid '{edge_data.source_uid}' does not exist.") from e
+        try:
             target_node_data = self.get_node(edge_data.target_uid)
+        except KeyError as e:
+            raise KeyError(
+                f"Error: Target node with node_uid '{edge_data.target_uid}' does not exist.") from e
+
+        edge_uid = self._generate_edge_uid(
+            edge_data.source_uid, edge_data.target_uid)
 
-            source_node_data.edges_to = list(
-                set(source_node_data.edges_to) | {edge_data.target_uid})
+        try:
+            if edge_data.target_uid not in source_node_data.edges_to:
+                source_node_data.edges_to.append(edge_data.target_uid)
             self.update_node(edge_data.source_uid, source_node_data)
 
             # Add the edge to the target node's edges_from
-            target_node_data.edges_from = list(
-                set(target_node_data.edges_from) | {edge_data.source_uid})
+            if edge_data.source_uid not in target_node_data.edges_from:
+                target_node_data.edges_from.append(edge_data.source_uid)
             self.update_node(edge_data.target_uid, target_node_data)
 
             # Add the edge to the edges collection
@@ -192,13 +179,13 @@ class MongoKG(NoSQLKnowledgeGraph):
                 reverse_edge_uid = self._generate_edge_uid(
                     edge_data.target_uid, edge_data.source_uid)
 
-                target_node_data.edges_to = list(
-                    set(target_node_data.edges_to) | {edge_data.source_uid})
+                if edge_data.source_uid not in target_node_data.edges_to:
+                    target_node_data.edges_to.append(edge_data.source_uid)
                 self.update_node(edge_data.target_uid, target_node_data)
 
                 # Since it's undirected, also add source_uid to target_node_data.edges_from
-                source_node_data.edges_from = list(
-                    set(source_node_data.edges_from) | {edge_data.target_uid})
+                if edge_data.target_uid not in source_node_data.edges_from:
+                    source_node_data.edges_from.append(edge_data.target_uid)
                 self.update_node(edge_data.source_uid, source_node_data)
 
                 # Add the reverse edge to the edges collection
@@ -265,16 +252,14 @@ class MongoKG(NoSQLKnowledgeGraph):
             source_node_data = self.get_node(edge_data.source_uid)
             # Ensure the target_uid is present in edges_to
             if edge_data.target_uid not in source_node_data.edges_to:
-                source_node_data.edges_to = list(
-                    set(source_node_data.edges_to) | {edge_data.target_uid})
+                source_node_data.edges_to.append(edge_data.target_uid)
                 self.update_node(edge_data.source_uid, source_node_data)
 
             # 3b. Update target node
             target_node_data = self.get_node(edge_data.target_uid)
             # Ensure the source_uid is present in edges_from
             if edge_data.source_uid not in target_node_data.edges_from:
-                target_node_data.edges_from = list(
-                    set(target_node_data.edges_from) | {edge_data.source_uid})
+                target_node_data.edges_from.append(edge_data.source_uid)
                 self.update_node(edge_data.target_uid, target_node_data)
 
         except Exception as e:
@@ -377,7 +362,8 @@ class MongoKG(NoSQLKnowledgeGraph):
         """
         pass
 
-    def _generate_edge_uid(self, source_uid: str, target_uid: str):
+    def _generate_edge_uid(self, source_uid: str, target_uid: str) -> str:
+        """Generates Edge uid for the network based on source and target nod uid"""
         return f"{source_uid}_to_{target_uid}"
 
     def _update_egde_coll(self, edge_uid: str, source_uid: str,
@@ -403,7 +389,7 @@ class MongoKG(NoSQLKnowledgeGraph):
         """Retrieves the community report for a given community id."""
         return
 
-    def list_communities(self) -> List[CommunityData]:
+    def list_communities(self) -> Iterator[CommunityData]:
         """Lists all stored communities for the given network."""
         return
 
@@ -1,7 +1,7 @@
 """Neo4j database operations"""
 
 import os
-from typing import List
+from typing import Iterator, List
 
 import dotenv
 
@@ -156,11 +156,11 @@ class AuraKG(NoSQLKnowledgeGraph):
         target_node_data = self.get_node(edge_data.target_uid)
 
         # update source and target node data
-        source_node_data.edges_to = list(
-            set(source_node_data.edges_to) | {edge_data.target_uid})
+        if edge_data.target_uid not in source_node_data.edges_to:
+            source_node_data.edges_to.append(edge_data.target_uid)
         self.update_node(edge_data.source_uid, source_node_data)
-        target_node_data.edges_from = list(
-            set(target_node_data.edges_from) | {edge_data.source_uid})
+        if edge_data.source_uid not in target_node_data.edges_from:
+            target_node_data.edges_from.append(edge_data.source_uid)
         self.update_node(edge_data.target_uid, target_node_data)
 
         self.driver.verify_connectivity()
@@ -178,11 +178,11 @@ class AuraKG(NoSQLKnowledgeGraph):
             """
 
             # Since it's undirected, also add source_uid to target_node_data.edges_from and vice versa
-            target_node_data.edges_to = list(
-                set(target_node_data.edges_to) | {edge_data.source_uid})
+            if edge_data.source_uid not in target_node_data.edges_to:
+                target_node_data.edges_to.append(edge_data.source_uid)
             self.update_node(edge_data.target_uid, target_node_data)
-            source_node_data.edges_from = list(
-                set(source_node_data.edges_from) | {edge_data.target_uid})
+            if edge_data.target_uid not in source_node_data.edges_from:
+                source_node_data.edges_from.append(edge_data.target_uid)
             self.update_node(edge_data.source_uid, source_node_data)
 
         summary = self.driver.execute_query(
@@ -380,7 +380,7 @@ class AuraKG(NoSQLKnowledgeGraph):
         """Retrieves the community report for a given community id."""
         pass
 
-    def list_communities(self) -> List[CommunityData]:
+    def list_communities(self) -> Iterator[CommunityData]:
         """Lists all stored communities for the given network."""
         pass
 
@@ -1,6 +1,7 @@
 """Module providing Data Model definitions for storing and processing Graph Data. """
 
-from dataclasses import dataclass, field
+import copy
+from dataclasses import dataclass, field, fields
 from typing import Tuple
 import numpy as np
 
@@ -29,6 +30,41 @@ class NodeData:
     edges_to: list[str] = field(default_factory=list)
     edges_from: list[str] = field(default_factory=list)  # in case of directed graph
     embedding: list[float] = field(default_factory=list)  # text embedding for node
+    # field values as last loaded from or saved to the store, used to detect changed fields
+    _loaded: dict | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __to_dict__(self) -> dict:
+        """Converts the NodeData instance to a dictionary."""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+
+    def _changed_fields(self, node_uid: str | None = None) -> dict:
+        """
+        Returns only the fields that changed since the instance was created via __from_dict__
+        or last saved, including in-place changes like edges_to.append().
+        Returns all fields if nothing was loaded or it was loaded for another node_uid.
+        """
+        node_data_dict = self.__to_dict__()
+        if self._loaded is None or (node_uid is not None and self._loaded.get("node_uid") != node_uid):
+            return node_data_dict
+        return {k: v for k, v in node_data_dict.items() if k not in self._loaded or self._loaded[k] != v}
+
+    def _mark_saved(self, saved: dict) -> None:
+        """Records copies of the saved field values as loaded state, later changes are compared to them."""
+        loaded = dict(self._loaded or {})
+        loaded.update({k: copy.copy(v) for k, v in saved.items()})
+        self._loaded = loaded
+
+    @classmethod
+    def __from_dict__(cls, data: dict):
+        """
+        Creates a NodeData instance from copies of the dictionary values and remembers
+        the original values as loaded state. The dictionary itself is not modified.
+        """
+        node_data = cls(**{k: copy.copy(v) for k, v in data.items()})
+        # fields missing in data hold their defaults
+        node_data._loaded = {k: copy.copy(v) for k, v in node_data.__to_dict__().items()
+                             if k not in data} | data
+        return node_data
 
 
 @dataclass